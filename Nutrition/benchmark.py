@@ -0,0 +1,221 @@
+"""Benchmark generowania wykresów: czas, przyrost RSS, liczba artystów i rozmiar pliku.
+
+Każdy przypadek (wykres x skala danych x format x backend) uruchamiany jest
+w osobnym procesie. Pamięć mierzona jest jako przyrost szczytowego RSS ponad
+poziom po importach i rozgrzewce, żeby ~100 MiB bibliotek nie maskowało zmian.
+
+    python benchmark.py                  # porównanie z zapisanym baseline
+    python benchmark.py --save-baseline  # zapis nowego baseline
+
+Baseline (benchmark_baseline.json) zależy od maszyny, więc nie jest
+w repozytorium - zapisz go lokalnie przed zmianami i porównuj na tej samej maszynie.
+"""
+import argparse
+import importlib
+import io
+import json
+import logging
+import multiprocessing as mp
+import os
+import resource
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from main import generate_bmi_charts, generate_age_charts, generate_radar_charts
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+# Skala mnoży liczbę kategorii BMI, grup wiekowych i produktów na wykresach radarowych
+SCALES = [1, 4, 16]
+
+FREQ_COLS = [
+    'Nigdy',
+    'Rzadziej niż 1 raz w miesiącu',
+    '1-3 razy w miesiącu',
+    '1 raz w tygodniu',
+    '2-3 razy w tygodniu',
+    '4-5 razy w tygodniu',
+    '1 raz dziennie',
+    'Kilka razy dziennie'
+]
+
+FORMATS = {
+    'png': ['agg', 'cairo'],
+    'svg': ['svg', 'cairo'],
+    'pdf': ['pdf', 'cairo'],
+}
+
+# Dopuszczalny wzrost względem baseline (mnożnik, margines bezwzględny),
+# zanim uznamy wynik za regresję; margines chroni małe wartości przed szumem
+THRESHOLDS = {
+    'time_s': (1.25, 0.01),
+    'rss_increase_kib': (1.15, 2048),
+    'artists': (1.0, 0),
+    'file_bytes': (1.10, 0),
+}
+
+
+def synthetic_inputs(chart, scale, seed=0):
+    rng = np.random.default_rng(seed)
+    n = 4 * scale
+
+    def shares(rows, cols):
+        return rng.dirichlet(np.ones(cols), size=rows) * 100
+
+    if chart == 'bmi':
+        return [
+            pd.DataFrame({'kategoria': [f'kategoria {i}' for i in range(n)],
+                          'procent': shares(1, n)[0]})
+            for _ in range(2)
+        ]
+    if chart == 'age':
+        cohorts = [f'{5 * i}-{5 * i + 4}' for i in range(n)]
+        return [
+            pd.DataFrame({'wiek': cohorts, 'procent': rng.uniform(20, 70, n)})
+            for _ in range(2)
+        ]
+    if chart == 'radar':
+        def frame():
+            df = pd.DataFrame(shares(n, len(FREQ_COLS)), columns=FREQ_COLS)
+            df.insert(0, 'Produkt', [f'Produkt {i}' for i in range(n)])
+            return df
+        return [(frame(), frame(), title) for title in ('Warzywa', 'Owoce', 'Nabiał')]
+    raise ValueError(f'Nieznany wykres: {chart}')
+
+
+def build_figure(chart, inputs):
+    if chart == 'bmi':
+        return generate_bmi_charts(*inputs, show=False)
+    if chart == 'age':
+        return generate_age_charts(df1=inputs[0], df2=inputs[1], show=False)
+    return generate_radar_charts(inputs, show=False)
+
+
+def has_cairo():
+    # Sam pakiet nie wystarczy - cairocffi rzuca OSError bez systemowej biblioteki cairo
+    for module in ('cairo', 'cairocffi'):
+        try:
+            importlib.import_module(module)
+            return True
+        except (ImportError, OSError):
+            pass
+    return False
+
+
+def available_backends():
+    cairo = has_cairo()
+    return {fmt: [b for b in backends if b != 'cairo' or cairo]
+            for fmt, backends in FORMATS.items()}
+
+
+def peak_rss_kib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS podaje ru_maxrss w bajtach, Linux w KiB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def render(chart, inputs, fmt, backend):
+    buf = io.BytesIO()
+    fig = build_figure(chart, inputs)
+    fig.savefig(buf, format=fmt, backend=backend)
+    return fig, buf
+
+
+def run_case(chart, scale, fmt, backend, repeat):
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+    # Rozgrzewka na najmniejszych danych: ładuje backend, czcionki i cache,
+    # żeby nie liczyły się do przyrostu pamięci badanego przypadku
+    fig, _ = render(chart, synthetic_inputs(chart, 1, seed=1), fmt, backend)
+    plt.close(fig)
+    rss_before = peak_rss_kib()
+
+    inputs = synthetic_inputs(chart, scale)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fig, buf = render(chart, inputs, fmt, backend)
+        times.append(time.perf_counter() - start)
+        artists = len(fig.findobj())
+        plt.close(fig)
+    return {
+        'time_s': min(times),
+        'rss_increase_kib': peak_rss_kib() - rss_before,
+        'peak_rss_kib': peak_rss_kib(),
+        'artists': artists,
+        'file_bytes': buf.getbuffer().nbytes,
+    }
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'wymagana liczba >= 1, podano {value}')
+    return number
+
+
+def run_all(charts, scales, repeat):
+    cases = [(chart, scale, fmt, backend)
+             for chart in charts
+             for scale in scales
+             for fmt, backends in available_backends().items()
+             for backend in backends]
+    results = {}
+    # Nowy proces na każdy przypadek - inaczej ru_maxrss rośnie tylko monotonicznie
+    ctx = mp.get_context('spawn')
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        for chart, scale, fmt, backend in cases:
+            key = f'{chart}/x{scale}/{fmt}/{backend}'
+            results[key] = pool.apply(run_case, (chart, scale, fmt, backend, repeat))
+            print(f"{key:<24} {results[key]['time_s']:8.3f} s "
+                  f"{results[key]['rss_increase_kib'] / 1024:+8.1f} MiB "
+                  f"{results[key]['artists']:6d} art. "
+                  f"{results[key]['file_bytes'] / 1024:9.1f} KiB")
+    return results
+
+
+def find_regressions(results, baseline):
+    regressions = []
+    for key, metrics in results.items():
+        if key not in baseline:
+            continue
+        for metric, (ratio, slack) in THRESHOLDS.items():
+            if metric not in baseline[key]:
+                continue
+            old, new = baseline[key][metric], metrics[metric]
+            if new > old * ratio + slack:
+                regressions.append(f'{key} {metric}: {old} -> {new}')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--charts', nargs='+', default=['bmi', 'age', 'radar'])
+    parser.add_argument('--scales', nargs='+', type=positive_int, default=SCALES)
+    parser.add_argument('--repeat', type=positive_int, default=3)
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args()
+
+    results = run_all(args.charts, args.scales, args.repeat)
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f'Zapisano baseline: {BASELINE_PATH}')
+        sys.exit(0)
+
+    if not os.path.exists(BASELINE_PATH):
+        print('Brak baseline - uruchom z --save-baseline.')
+        sys.exit(0)
+
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = find_regressions(results, baseline)
+    for line in regressions:
+        print(f'REGRESJA {line}')
+    sys.exit(1 if regressions else 0)
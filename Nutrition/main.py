@@ -4,42 +4,33 @@ import matplotlib.pyplot as plt
 import matplotlib as mpl
 import matplotlib.ticker as mtick
 import matplotlib.font_manager as fm
-from matplotlib.colors import to_rgb
 import numpy as np
 
-fm.fontManager = fm.FontManager()
-mpl.rcParams['font.family'] = ['Roboto']
-
-def create_figsize_px(width_px, height_px, dpi=300):
-    figsize = (width_px / dpi, height_px / dpi)
-    return figsize
-
-def pastelize(color, factor=0.5):
-    """Miesza color z bielą; factor 0–1: im wyższy, tym jaśniejszy."""
-    r, g, b = to_rgb(color)
-    return (r + (1-r)*factor,
-            g + (1-g)*factor,
-            b + (1-b)*factor)
+from spec import get_template
 
-def generate_bmi_charts():
-    df1 = pd.read_csv('bmi_male.csv')
-    df2 = pd.read_csv('bmi_female.csv')
+fm.fontManager = fm.FontManager()
+template = get_template()
+mpl.rcParams.update(template['rc'])
+fonts = template['fonts']
 
-    labels1 = df1['kategoria'].astype(str).tolist()
-    sizes1 = df1['procent'].astype(float).tolist()
+def generate_bmi_charts(df1=None, df2=None, show=True):
+    if df1 is None:
+        df1 = pd.read_csv('bmi_male.csv')
+    if df2 is None:
+        df2 = pd.read_csv('bmi_female.csv')
 
-    labels2 = df2['kategoria'].astype(str).tolist()
-    sizes2 = df2['procent'].astype(float).tolist()
+    label_col, value_col = template['bindings']['bmi']['label'], template['bindings']['bmi']['value']
 
-    base_blue = 'blue'
-    base_maroon = 'firebrick'
+    labels1 = df1[label_col].astype(str).tolist()
+    sizes1 = df1[value_col].astype(float).tolist()
 
-    colors1 = [pastelize(base_blue, factor=0.5)] * len(labels1)
-    colors2 = [pastelize(base_maroon, factor=0.5)] * len(labels2)
+    labels2 = df2[label_col].astype(str).tolist()
+    sizes2 = df2[value_col].astype(float).tolist()
 
-    figsize_bmi = create_figsize_px(920, 420, 100)
+    colors1 = [template['colors']['male']] * len(labels1)
+    colors2 = [template['colors']['female']] * len(labels2)
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize_bmi, dpi=100)
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=template['figsize']['bmi'], dpi=template['dpi']['bmi'])
 
     squarify.plot(
         sizes=sizes1,
@@ -48,10 +39,10 @@ def generate_bmi_charts():
         alpha=0.8,
         pad=True,
         ax=ax1,
-        text_kwargs={'fontsize': 10, 'fontweight': 'normal'}
+        text_kwargs={'fontsize': fonts['label'], 'fontweight': 'normal'}
     )
     ax1.axis('off')
-    ax1.set_title('Mężczyźni', fontsize=16)
+    ax1.set_title('Mężczyźni', fontsize=fonts['title'])
 
     squarify.plot(
         sizes=sizes2,
@@ -60,37 +51,36 @@ def generate_bmi_charts():
         alpha=0.8,
         pad=True,
         ax=ax2,
-        text_kwargs={'fontsize': 10, 'fontweight': 'normal'}
+        text_kwargs={'fontsize': fonts['label'], 'fontweight': 'normal'}
     )
     ax2.axis('off')
-    ax2.set_title('Kobiety', fontsize=16)
+    ax2.set_title('Kobiety', fontsize=fonts['title'])
 
     plt.tight_layout(rect=[0, 0, 1, 0.95])
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
-def generate_age_charts(gap=6.0, label_offset=2):
-    df1 = pd.read_csv('pojadanie_male.csv')
-    df2 = pd.read_csv('pojadanie_female.csv')
+def generate_age_charts(gap=6.0, label_offset=2, df1=None, df2=None, show=True):
+    if df1 is None:
+        df1 = pd.read_csv('pojadanie_male.csv')
+    if df2 is None:
+        df2 = pd.read_csv('pojadanie_female.csv')
 
-    age_groups = df1['wiek'].tolist()
-    men_percents = df1['procent'].tolist()
-    women_percents = df2['procent'].tolist()
+    label_col, value_col = template['bindings']['age']['label'], template['bindings']['age']['value']
 
-    figsize_age = create_figsize_px(920, 250, 100)
+    age_groups = df1[label_col].tolist()
+    men_percents = df1[value_col].tolist()
+    women_percents = df2[value_col].tolist()
 
-    fig, ax = plt.subplots(figsize=figsize_age, dpi=100)
+    fig, ax = plt.subplots(figsize=template['figsize']['age'], dpi=template['dpi']['age'])
 
     men_lefts = [-p for p in men_percents]
     men_widths = [p - gap for p in men_percents]
     women_lefts = [gap] * len(women_percents)
     women_widths = [p - gap for p in women_percents]
-    labels1 = df1['wiek'].astype(str).tolist()
-    labels2 = df2['wiek'].astype(str).tolist()
-
-    base_blue = 'blue'
-    base_maroon = 'firebrick'
-    colors1 = [pastelize(base_blue, factor=0.5)] * len(labels1)
-    colors2 = [pastelize(base_maroon, factor=0.5)] * len(labels2)
+    colors1 = [template['colors']['male']] * len(men_percents)
+    colors2 = [template['colors']['female']] * len(women_percents)
 
     bars_m = ax.barh(age_groups, men_widths, left=men_lefts,
                      color=colors1, label='Mężczyźni', align='center')
@@ -129,61 +119,48 @@ def generate_age_charts(gap=6.0, label_offset=2):
     ax.set_xlabel('Procent próby')
 
     fig.text(0.35, 0.90, 'Mężczyźni', ha='center', va='bottom',
-             fontsize=16)
+             fontsize=fonts['title'])
     fig.text(0.65, 0.90, 'Kobiety', ha='center', va='bottom',
-             fontsize=16)
+             fontsize=fonts['title'])
 
     plt.tight_layout(rect=[0, 0, 1, 0.95])
-    plt.show()
-
-def generate_radar_charts():
-    df1 = pd.read_csv('warzywa_male.csv')
-    df2 = pd.read_csv('warzywa_female.csv')
-    df3 = pd.read_csv('owoce_male.csv')
-    df4 = pd.read_csv('owoce_female.csv')
-    df5 = pd.read_csv('nabial_male.csv')
-    df6 = pd.read_csv('nabial_female.csv')
+    if show:
+        plt.show()
+    return fig
+
+def generate_radar_charts(specs=None, show=True):
+    # specs: lista trójek (df mężczyźni, df kobiety, tytuł) - domyślnie z plików CSV
+    if specs is None:
+        specs = [
+            (pd.read_csv('warzywa_male.csv'), pd.read_csv('warzywa_female.csv'), 'Warzywa'),
+            (pd.read_csv('owoce_male.csv'), pd.read_csv('owoce_female.csv'), 'Owoce'),
+            (pd.read_csv('nabial_male.csv'), pd.read_csv('nabial_female.csv'), 'Nabiał'),
+        ]
 
-
-
-    base_blue = 'blue'
-    base_maroon = 'firebrick'
     colors = [
-        pastelize(base_blue, factor=0.5),
-        pastelize(base_maroon, factor=0.5)
+        template['colors']['male'],
+        template['colors']['female']
     ]
 
     label_odd = 'Mężczyźni'
     label_even = 'Kobiety'
 
-    figsize_radar_charts = create_figsize_px(1840, 840, 100)
-
     fig, axes = plt.subplots(
         nrows=1,
-        ncols=3,
-        figsize=figsize_radar_charts,
-        subplot_kw={'projection': 'polar'}
+        ncols=len(specs),
+        figsize=template['figsize']['radar'],
+        dpi=template['dpi']['radar'],
+        subplot_kw={'projection': 'polar'},
+        squeeze=False
     )
 
-    specs = [
-        (df1, df2, 'Warzywa'),
-        (df3, df4, 'Owoce'),
-        (df5, df6, 'Nabiał'),
-    ]
-
-    weekly_cols = [
-        '1 raz w tygodniu',
-        '2-3 razy w tygodniu',
-        '4-5 razy w tygodniu',
-        '1 raz dziennie',
-        'Kilka razy dziennie'
-    ]
+    label_col, weekly_cols = template['bindings']['radar']['label'], template['bindings']['radar']['value']
 
     all_handles = []
     all_labels = []
 
-    for ax, (dfa, dfb, title) in zip(axes, specs):
-        products = dfa['Produkt'].tolist()
+    for ax, (dfa, dfb, title) in zip(axes[0], specs):
+        products = dfa[label_col].tolist()
         M = len(products)
 
         angles = np.linspace(0, 2 * np.pi, M, endpoint=False).tolist()
@@ -236,15 +213,15 @@ def generate_radar_charts():
             all_labels.extend([label_odd, label_even])
 
         ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(products, fontsize=12, horizontalalignment="center", verticalalignment="top", rotation=40, rotation_mode='anchor')
+        ax.set_xticklabels(products, fontsize=fonts['tick'], horizontalalignment="center", verticalalignment="top", rotation=40, rotation_mode='anchor')
         ax.tick_params(axis='x', pad=25)
 
-        ax.set_title(title, y=1.15, fontsize=32)
+        ax.set_title(title, y=1.15, fontsize=fonts['radar_title'])
 
         ax.set_rlabel_position(30)
         ax.set_ylim(0, 100)
         ax.set_yticks([20, 40, 60, 80, 100])
-        ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'], fontsize=12)
+        ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'], fontsize=fonts['tick'])
 
     fig.legend(
         all_handles,
@@ -252,7 +229,7 @@ def generate_radar_charts():
         loc='upper center',
         ncol=2,
         bbox_to_anchor=(0.5, 0.95),
-        fontsize=16,
+        fontsize=fonts['legend'],
         frameon=False
     )
 
@@ -262,12 +239,14 @@ def generate_radar_charts():
         'Wartości jako procent próby deklarującej spożycie danego produktu przynajmniej raz na tydzień',
         ha='left',
         va='bottom',
-        fontsize=14,
+        fontsize=fonts['note'],
         color='gray'
     )
 
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 if __name__ == '__main__':
     generate_bmi_charts()
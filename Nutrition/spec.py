@@ -0,0 +1,76 @@
+"""Deklaratywna specyfikacja wykresów Nutrition i jej kompilacja do szablonu matplotlib.
+
+Domyślna specyfikacja kompilowana jest raz przy imporcie i współdzielona przez
+wszystkie wykresy w procesie. Kompilacja jest tańsza niż odczyt pliku, więc
+szablon nie jest zapisywany na dysk.
+"""
+from matplotlib.colors import to_rgb
+
+SPEC = {
+    'palette': {
+        'male': {'base': 'blue', 'pastel': 0.5},
+        'female': {'base': 'firebrick', 'pastel': 0.5},
+    },
+    'fonts': {
+        'family': 'Roboto',
+        'label': 10,
+        'tick': 12,
+        'note': 14,
+        'title': 16,
+        'legend': 16,
+        'radar_title': 32,
+    },
+    'layout': {
+        'bmi': {'size_px': [920, 420], 'dpi': 100},
+        'age': {'size_px': [920, 250], 'dpi': 100},
+        'radar': {'size_px': [1840, 840], 'dpi': 100},
+    },
+    'bindings': {
+        'bmi': {'label': 'kategoria', 'value': 'procent'},
+        'age': {'label': 'wiek', 'value': 'procent'},
+        'radar': {
+            'label': 'Produkt',
+            'value': [
+                '1 raz w tygodniu',
+                '2-3 razy w tygodniu',
+                '4-5 razy w tygodniu',
+                '1 raz dziennie',
+                'Kilka razy dziennie'
+            ],
+        },
+    },
+}
+
+
+def create_figsize_px(width_px, height_px, dpi=300):
+    figsize = (width_px / dpi, height_px / dpi)
+    return figsize
+
+
+def pastelize(color, factor=0.5):
+    """Miesza color z bielą; factor 0–1: im wyższy, tym jaśniejszy."""
+    r, g, b = to_rgb(color)
+    return (r + (1-r)*factor,
+            g + (1-g)*factor,
+            b + (1-b)*factor)
+
+
+def compile_spec(spec):
+    """Zamienia specyfikację na gotowe wartości dla matplotlib (kolory RGB, figsize, rcParams)."""
+    return {
+        'rc': {'font.family': [spec['fonts']['family']]},
+        'colors': {name: pastelize(c['base'], factor=c['pastel'])
+                   for name, c in spec['palette'].items()},
+        'fonts': {k: v for k, v in spec['fonts'].items() if k != 'family'},
+        'figsize': {name: create_figsize_px(*l['size_px'], l['dpi'])
+                    for name, l in spec['layout'].items()},
+        'dpi': {name: l['dpi'] for name, l in spec['layout'].items()},
+        'bindings': spec['bindings'],
+    }
+
+
+TEMPLATE = compile_spec(SPEC)
+
+
+def get_template(spec=SPEC):
+    return TEMPLATE if spec is SPEC else compile_spec(spec)
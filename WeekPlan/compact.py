@@ -0,0 +1,141 @@
+"""Zwarta reprezentacja planu współdzielona przez procesy (np. workery gunicorna).
+
+Plan zapisywany jest raz do pliku .npy jako tablica rekordów: minuty początku
+i końca (int16) oraz kody dnia i kategorii (uint8). Każdy proces mapuje plik
+tylko do odczytu, więc strony są współdzielone przez cache systemu plików,
+a nie kopiowane do pamięci każdego workera.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+import pipeline
+import spec
+from pipeline import normalize_plan
+
+PLAN_DTYPE = np.dtype([
+    ("start", "<i2"),
+    ("end", "<i2"),
+    ("day", "u1"),
+    ("category", "u1"),
+])
+
+
+class CompactPlan:
+    def __init__(self, records, categories, day_order, key=None):
+        self.records = records
+        self.categories = list(categories)
+        self.day_order = list(day_order)
+        # Klucz pliku .npy (źródło, argumenty, wersja kodu) - także dla danych wyprowadzonych z planu
+        self.key = key
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def start_hours(self):
+        return self.records["start"] / 60
+
+    @property
+    def duration_hours(self):
+        return (self.records["end"] - self.records["start"]) / 60
+
+    def category_codes_in_order(self):
+        """Kody kategorii w kolejności pierwszego wystąpienia w planie."""
+        codes, first = np.unique(self.records["category"], return_index=True)
+        return codes[np.argsort(first)]
+
+    def hours_by_category(self, day=None):
+        """Suma godzin każdej kategorii (indeks = kod), opcjonalnie tylko dla jednego dnia."""
+        records = self.records
+        if day is not None:
+            records = records[records["day"] == self.day_order.index(day)]
+        duration = (records["end"] - records["start"]) / 60
+        return np.bincount(records["category"], weights=duration, minlength=len(self.categories))
+
+
+def code_version(*paths):
+    """Skrót treści plików źródłowych - zmiana kodu unieważnia zapisane wyniki."""
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Kod, od którego zależy zakodowany plan: walidacja, specyfikacja i samo kodowanie
+PLAN_CODE = code_version(pipeline.__file__, spec.__file__, __file__)
+
+
+def encode_plan(frame, categories, day_order):
+    """Koduje znormalizowany plan; kategorie spoza listy dopisywane są na jej koniec."""
+    categories = list(categories)
+    categories += [cat for cat in pd.unique(frame["Category"]) if cat not in categories]
+    if len(categories) > np.iinfo(np.uint8).max + 1:
+        raise ValueError("Za dużo kategorii dla kodu uint8")
+
+    records = np.empty(len(frame), dtype=PLAN_DTYPE)
+    records["start"] = np.rint(frame["StartFloat"].to_numpy() * 60)
+    records["end"] = np.rint(frame["EndFloat"].to_numpy() * 60)
+    records["day"] = pd.Categorical(frame["Day"], categories=day_order).codes
+    records["category"] = pd.Categorical(frame["Category"], categories=categories).codes
+    return records, categories
+
+
+def attach_plan(csv_path, categories, day_order, cache_path=None):
+    """Zwraca (CompactPlan, błędy walidacji) dla pliku CSV.
+
+    Jeśli zakodowany plik jest aktualny (ten sam CSV, argumenty i kod
+    walidacji), jest tylko mapowany do pamięci; w przeciwnym razie plan jest parsowany, kodowany i zapisywany
+    atomowo, żeby równolegle startujące workery nie odczytały połowy pliku.
+    Błędy walidacji zapisywane są w pliku .json obok, więc każdy proces je dostaje.
+    """
+    cache_path = cache_path or f"{os.path.splitext(csv_path)[0]}.plan.npy"
+    meta_path = f"{cache_path}.json"
+    stat = os.stat(csv_path)
+    key = {
+        "source": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns},
+        "categories": list(categories),
+        "day_order": list(day_order),
+        "code": PLAN_CODE,
+    }
+
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["key"] == key:
+            records = np.load(cache_path, mmap_mode="r")
+            return CompactPlan(records, meta["categories"], day_order, key), meta["errors"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    frame, errors = normalize_plan(pd.read_csv(csv_path), csv_path)
+    records, categories = encode_plan(frame, categories, day_order)
+
+    pid = os.getpid()
+    np.save(f"{cache_path}.{pid}.tmp.npy", records)
+    os.replace(f"{cache_path}.{pid}.tmp.npy", cache_path)
+    with open(f"{meta_path}.{pid}.tmp", "w", encoding="utf-8") as f:
+        json.dump({"key": key, "categories": categories, "errors": errors}, f, ensure_ascii=False)
+    os.replace(f"{meta_path}.{pid}.tmp", meta_path)
+
+    return CompactPlan(np.load(cache_path, mmap_mode="r"), categories, day_order, key), errors
+
+
+def memory_usage():
+    """RSS i PSS bieżącego procesu w KiB (PSS dzieli strony współdzielone między procesy)."""
+    usage = {"pid": os.getpid()}
+    try:
+        with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                if key in ("Rss", "Pss", "Shared_Clean", "Private_Dirty"):
+                    usage[f"{key.lower()}_kib"] = int(value.split()[0])
+    except OSError:
+        # Bez /proc (macOS) - tylko szczytowe RSS
+        import resource
+        usage["max_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage
@@ -1,27 +1,35 @@
 import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output, State
+import plotly
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
 import os
 import kaleido
 from plotly.subplots import make_subplots
 import plotly.io as pio
+import contextlib
 import copy
+import json
+from flask import jsonify
+
+from compact import attach_plan, code_version, memory_usage
+from renditions import can_rasterize, rasterize, rendition_pool
+from spec import register_template
+from trends import open_store
 
 kaleido.get_chrome_sync()
 
+# Skompilowany szablon (czcionki, paleta, układ osi) - domyślny dla wszystkich figur
+template = register_template()
+
 def float_to_time(hours):
     h = int(hours)
     m = int((hours - h) * 60)
     return f"{h:02d}:{m:02d}"
 
-# Funkcja konwertująca czas w formacie "HH:MM" na liczbę godzin, w typie float
-def time_to_float(t):
-    h, m = map(int, t.split(':'))
-    return h + m / 60
-
 external_stylesheets = [
     {
         "href": "https://fonts.googleapis.com/css2?family=Roboto:wght@400;700&family=Roboto+Slab:wght@400;700&display=swap",
@@ -29,206 +37,251 @@ external_stylesheets = [
     }
 ]
 
-# Wczytanie danych z pliku CSV
-data = pd.read_csv("plan.csv")
-
-# Wstępne czyszczenie danych
-data.columns = [col.strip() for col in data.columns]
-data["StartTime"] = data["StartTime"].str.strip()
-data["EndTime"] = data["EndTime"].str.strip()
-data["Category"] = data["Category"].str.strip()
-data["Day"] = data["Day"].str.strip()
+# Kolory kategorii ze specyfikacji
+kolory = template["colors"]
+fallback_color = template["fallback_color"]
 
-# Konwersja danych czasowych na liczby
-data["StartFloat"] = data["StartTime"].apply(time_to_float)
-data["EndFloat"] = data["EndTime"].apply(time_to_float)
-data["Duration"] = data["EndFloat"] - data["StartFloat"]
+# Plan z pliku CSV w zwartej postaci (int16 minuty, uint8 kody dnia i kategorii),
+# mapowany z pliku .npy - workery serwera współdzielą go zamiast trzymać własne kopie
+plan, plan_errors = attach_plan("plan.csv", kolory.keys(), template["day_order"])
+for error in plan_errors:
+    print(f"plan.csv, wiersz {error['row']}: {error['message']} ({error['column']}={error['value']})")
 
 # Ustalenie pozycji na osi Y dla dni tygodnia
-day_order = ["Poniedziałek", "Wtorek", "Środa", "Czwartek", "Piątek", "Sobota", "Niedziela"]
-day_order.reverse()
-day_y = {day: i * 10 for i, day in enumerate(day_order)}
-bar_height = 5
-
-# Grupowanie danych do wykresu aktywności
-categories = {}
-for idx, row in data.iterrows():
-    cat = row["Category"]
-    if cat not in categories:
-        categories[cat] = {"x": [], "width": [], "y": []}
-    categories[cat]["x"].append(row["StartFloat"])
-    categories[cat]["width"].append(row["Duration"])
-    categories[cat]["y"].append(day_y.get(row["Day"], 0))
-
-# Definicja kolorów dla kategorii
-kolory = {
-    "Sen": "darkblue",
-    "Odpoczynek i rozrywka": "green",
-    "Transport": "gray",
-    "Studia": "orange",
-    "Obowiązki": "saddlebrown",
-    "Praca": "darkmagenta",
-    "Siłownia": "red"
-}
-
-# Interaktywny słupkowy wykres aktywności
-traces = []
-for cat, data_cat in categories.items():
-    trace = go.Bar(
-        name=f'{cat}',
-        x=data_cat["width"],
-        y=data_cat["y"],
-        base=data_cat["x"],
-        orientation='h',
-        width=bar_height,
-        marker=dict(
-            color=kolory.get(cat, "lightgray"),
-            opacity=1
-        ),
-        customdata=[[float_to_time(x), float_to_time(x + w), float_to_time((x + w) - x)] for x, w in zip(data_cat["x"], data_cat["width"])],
-        hovertemplate=(
-            "Kategoria: " + cat +
-            "<br>Start: %{customdata[0]}" +
-            "<br>Koniec: %{customdata[1]}" +
-            "<br>Czas trwania: %{customdata[2]}" +
-            "<extra></extra>"
+day_order = list(template["day_order"])
+day_y = template["day_y"]
+bar_height = template["bar_height"]
+
+def hours_summary(day=None):
+    # Suma godzin kategorii obecnych w planie (lub danym dniu), alfabetycznie
+    hours = pd.Series(plan.hours_by_category(day), index=plan.categories)
+    records = plan.records if day is None else plan.records[plan.records["day"] == plan.day_order.index(day)]
+    present = [plan.categories[code] for code in np.unique(records["category"])]
+    return hours[present].sort_index()
+
+def build_figures():
+    # Grupowanie danych do wykresu aktywności
+    day_y_by_code = np.array([day_y[day] for day in plan.day_order])
+    categories = {}
+    for code in plan.category_codes_in_order():
+        mask = plan.records["category"] == code
+        categories[plan.categories[code]] = {
+            "x": plan.start_hours[mask].tolist(),
+            "width": plan.duration_hours[mask].tolist(),
+            "y": day_y_by_code[plan.records["day"][mask]].tolist(),
+        }
+
+    # Interaktywny słupkowy wykres aktywności
+    traces = []
+    for cat, data_cat in categories.items():
+        trace = go.Bar(
+            name=f'{cat}',
+            x=data_cat["width"],
+            y=data_cat["y"],
+            base=data_cat["x"],
+            orientation='h',
+            width=bar_height,
+            marker=dict(
+                color=kolory.get(cat, fallback_color),
+                opacity=1
+            ),
+            customdata=[[float_to_time(x), float_to_time(x + w), float_to_time((x + w) - x)] for x, w in zip(data_cat["x"], data_cat["width"])],
+            hovertemplate=(
+                "Kategoria: " + cat +
+                "<br>Start: %{customdata[0]}" +
+                "<br>Koniec: %{customdata[1]}" +
+                "<br>Czas trwania: %{customdata[2]}" +
+                "<extra></extra>"
+            )
         )
+        traces.append(trace)
+
+    layout1 = go.Layout(
+        title={
+            "text": "Podział aktywności według dni tygodnia"
+        },
+        xaxis=dict(
+            title="Godzina",
+            range=[0, 24],
+            categoryorder='array',
+            categoryarray=day_order[::-1],
+            dtick=1,
+            tickmode='linear'),
+        yaxis=dict(
+            title="Dzień tygodnia",
+            tickvals=list(day_y.values()),
+            ticktext=list(day_y.keys())
+        ),
+        clickmode='event+select',
+        barmode='stack'
     )
-    traces.append(trace)
-
-layout1 = go.Layout(
-    title={
-        "text": "Podział aktywności według dni tygodnia",
-        "font": {
-            "family": "Roboto Slab, serif",
-            "size": 24,
-            "color": "#000"
-        }
-    },
-    xaxis=dict(
-        title="Godzina",
-        range=[0, 24],
-        categoryorder='array',
-        categoryarray=day_order,
-        dtick=1,
-        tickmode='linear'),
-    yaxis=dict(
-        title="Dzień tygodnia",
-        tickvals=list(day_y.values()),
-        ticktext=list(day_y.keys())
-    ),
-    clickmode='event+select',
-    barmode='stack',
-    font={
-        "family": "Roboto, sans-serif",
-        "size": 14,
-        "color": "#333"
-    }
-)
 
-fig1 = go.Figure(data=traces, layout=layout1)
+    fig1 = go.Figure(data=traces, layout=layout1)
 
-# Wykres podsumowujący udział każdej kategorii w całym tygodniu
-total_week_hours = 7 * 24
-summary = data.groupby("Category")["Duration"].sum().reset_index()
-summary["Percent"] = summary["Duration"] / total_week_hours * 100
+    # Wykres podsumowujący udział każdej kategorii w całym tygodniu
+    total_week_hours = 7 * 24
+    summary = hours_summary()
+    summary_percent = summary / total_week_hours * 100
 
-trace_summary = go.Bar(
-    x=summary["Category"],
-    y=summary["Percent"],
-    marker=dict(color=[kolory.get(cat, "lightgray") for cat in summary["Category"]]),
-    text=[f"{p:.1f}%" for p in summary["Percent"]],
-    textposition="auto",
-    hovertemplate="Kategoria: %{x}<br>Udział: %{y:.1f}%<extra></extra>"
-)
-layout_summary = go.Layout(
-    title={
-        "text": "Procentowy udział kategorii w całkowitym czasie tygodnia",
-        "font": {
-            "family": "Roboto Slab, serif",
-            "size": 24,
-            "color": "#000"
-        }
-    },
-    yaxis=dict(title="Procent"),
-    xaxis=dict(title="Kategoria"),
-    font={
-        "family": "Roboto, sans-serif",
-        "size": 14,
-        "color": "#333"
-    }
-)
-fig2 = go.Figure(data=[trace_summary], layout=layout_summary)
-
-day_order.reverse()
-# 7 wykresów donut przedstawiających procentowy udział w czasie dnia
-fig3 = make_subplots(rows=1, cols=7, specs=[[{'type': 'domain'}]*7],
-                     subplot_titles=day_order)
-
-for i, day in enumerate(day_order, start=1):
-    day_data = data[data["Day"] == day]
-    if day_data.empty:
-        fig3.add_trace(go.Pie(
-            labels=["Brak danych"],
-            values=[1],
-            hole=0.4,
-            marker=dict(colors=["white"])
-        ), row=1, col=i)
-    else:
-        group = day_data.groupby("Category")["Duration"].sum().reset_index()
-        total_day = group["Duration"].sum()
-        group["Percent"] = group["Duration"] / total_day * 100
-        fig3.add_trace(go.Pie(
-            labels=group["Category"],
-            values=group["Percent"],
-            hole=0.5,
-            marker=dict(
-                colors=[kolory.get(cat, "lightgray") for cat in group["Category"]],
-                line=dict(color='#ffffff', width=2)
-            ),
-            textinfo="none",
-            hovertemplate="Kategoria: %{label}<br>Udział: %{percent:.1%}<extra></extra>"
-        ), row=1, col=i)
-
-fig3.update_layout(
-    title={
-        "text": "Procentowy udział kategorii w czasie aktywności poszczególnych dni",
-        "font": {
-            "family": "Roboto Slab, serif",
-            "size": 24,
-            "color": "#000"
+    trace_summary = go.Bar(
+        x=summary.index,
+        y=summary_percent,
+        marker=dict(color=[kolory.get(cat, fallback_color) for cat in summary.index]),
+        text=[f"{p:.1f}%" for p in summary_percent],
+        textposition="auto",
+        hovertemplate="Kategoria: %{x}<br>Udział: %{y:.1f}%<extra></extra>"
+    )
+    layout_summary = go.Layout(
+        title={
+            "text": "Procentowy udział kategorii w całkowitym czasie tygodnia"
+        },
+        yaxis=dict(title="Procent"),
+        xaxis=dict(title="Kategoria")
+    )
+    fig2 = go.Figure(data=[trace_summary], layout=layout_summary)
+
+    # 7 wykresów donut przedstawiających procentowy udział w czasie dnia
+    fig3 = make_subplots(rows=1, cols=7, specs=[[{'type': 'domain'}]*7],
+                         subplot_titles=day_order)
+
+    for i, day in enumerate(day_order, start=1):
+        group = hours_summary(day)
+        if group.empty:
+            fig3.add_trace(go.Pie(
+                labels=["Brak danych"],
+                values=[1],
+                hole=0.4,
+                marker=dict(colors=["white"])
+            ), row=1, col=i)
+        else:
+            group_percent = group / group.sum() * 100
+            fig3.add_trace(go.Pie(
+                labels=group.index,
+                values=group_percent,
+                hole=0.5,
+                marker=dict(
+                    colors=[kolory.get(cat, fallback_color) for cat in group.index],
+                    line=dict(color='#ffffff', width=2)
+                ),
+                textinfo="none",
+                hovertemplate="Kategoria: %{label}<br>Udział: %{percent:.1%}<extra></extra>"
+            ), row=1, col=i)
+
+    fig3.update_layout(
+        title={
+            "text": "Procentowy udział kategorii w czasie aktywności poszczególnych dni"
         }
-    },
-    font={
-        "family": "Roboto, sans-serif",
-        "size": 14,
-        "color": "#333"
-    }
-)
+    )
+    return {"activity": fig1, "summary": fig2, "donut": fig3}
+
+# Figury zapisane raz jako JSON obok planu, zamiast budowania obiektów plotly
+# w każdym workerze. Worker trzyma tylko wczytany JSON i czyta plik ponownie
+# dopiero, gdy ten się zmieni
+FIGURES_PATH = "plan.figures.json"
+# Figury zależą od planu (klucz obejmuje kod walidacji i specyfikację),
+# kodu, który je buduje, i wersji plotly (szablon jest osadzony w JSON)
+FIGURES_KEY = {"plan": plan.key, "code": code_version(__file__), "plotly": plotly.__version__}
+_figures = (None, None)
+
+def read_figures():
+    # Plik czytany ponownie tylko po zmianie (i-węzeł, rozmiar, mtime); None przy nieaktualnym kluczu
+    global _figures
+    stat = os.stat(FIGURES_PATH)
+    version = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    if _figures[0] != version:
+        with open(FIGURES_PATH, encoding="utf-8") as f:
+            cached = json.load(f)
+        _figures = (version, cached["figures"] if cached["key"] == FIGURES_KEY else None)
+    return _figures[1]
+
+def shared_figures():
+    """Słownik nazwa -> figura (JSON); buduje i zapisuje atomowo tylko przy zmianie klucza."""
+    try:
+        figures = read_figures()
+        if figures is not None:
+            return figures
+    except (OSError, ValueError, KeyError):
+        pass
+
+    figures = {name: fig.to_plotly_json() for name, fig in build_figures().items()}
+    tmp_path = f"{FIGURES_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(pio.json.to_json_plotly({"key": FIGURES_KEY, "figures": figures}))
+    os.replace(tmp_path, FIGURES_PATH)
+    return read_figures()
+
+# Magazyn tygodniowych sum kategorii do wykresu trendów (zasilany przez trends.py)
+trend_store = open_store("trends.dat")
+trend_window = 4
+
+def trend_figure(selected):
+    fig = go.Figure()
+    # Magazyn ma własną listę kategorii - nowe kategorie ze specyfikacji są w nim jako "Inne"
+    for cat in (cat for cat in selected if cat in trend_store.categories):
+        weeks, share = trend_store.weekly_share(cat)
+        _, rolling = trend_store.rolling_share(cat, window=trend_window)
+        color = kolory.get(cat, fallback_color)
+        fig.add_trace(go.Scatter(
+            x=weeks, y=share, name=cat, legendgroup=cat,
+            mode='lines+markers', line=dict(color=color),
+            hovertemplate="Tydzień od %{x|%d.%m.%Y}<br>" + cat + ": %{y:.1f}%<extra></extra>"
+        ))
+        fig.add_trace(go.Scatter(
+            x=weeks, y=rolling, name=f"{cat} (średnia {trend_window} tyg.)", legendgroup=cat,
+            mode='lines', line=dict(color=color, dash='dash'),
+            hovertemplate="Tydzień od %{x|%d.%m.%Y}<br>Średnia: %{y:.1f}%<extra></extra>"
+        ))
+    fig.update_layout(
+        title={"text": "Tygodniowy udział kategorii w czasie"},
+        xaxis=dict(title="Tydzień"),
+        yaxis=dict(title="Procent tygodnia", rangemode='tozero')
+    )
+    return fig
 
-# Układ z trzema wykresami
+# Układ z wykresami
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
-app.layout = html.Div([
-    html.Div([
-        dcc.Graph(
-            id='activity-graph',
-            figure=fig1
-        )
-    ], style={'margin-bottom': '50px'}),
-    html.Div([
-        dcc.Graph(
-            id='summary-graph',
-            figure=fig2
-        )
-    ], style={'margin-bottom': '50px'}),
-    html.Div([
-        dcc.Graph(
-            id='donut-graph',
-            figure=fig3
-        )
-    ]),
-    html.Div("Kliknij na słupek w wykresie aktywności, aby wyszarzyć pozostałe kategorie.")
-])
+server = app.server
+
+# Zużycie pamięci workera (RSS/PSS) - do porównania przy różnej liczbie workerów
+@server.route("/memory")
+def memory():
+    return jsonify(memory_usage())
+
+# Układ budowany przy każdym wyświetleniu strony - figury z pamięci procesu, odświeżane po zmianie pliku
+def serve_layout():
+    figures = shared_figures()
+    return html.Div([
+        html.Div([
+            dcc.Graph(
+                id='activity-graph',
+                figure=figures["activity"]
+            )
+        ], style={'margin-bottom': '50px'}),
+        html.Div([
+            dcc.Graph(
+                id='summary-graph',
+                figure=figures["summary"]
+            )
+        ], style={'margin-bottom': '50px'}),
+        html.Div([
+            dcc.Graph(
+                id='donut-graph',
+                figure=figures["donut"]
+            )
+        ], style={'margin-bottom': '50px'}),
+        html.Div([
+            dcc.Dropdown(
+                id='trend-categories',
+                options=trend_store.categories,
+                value=[cat for cat in ["Sen", "Praca"] if cat in trend_store.categories],
+                multi=True
+            ),
+            dcc.Graph(id='trend-graph')
+        ], style={'margin-bottom': '50px'}),
+        html.Div("Kliknij na słupek w wykresie aktywności, aby wyszarzyć pozostałe kategorie.")
+    ])
+
+app.layout = serve_layout
 
 # wyszarzanie nieklikniętych kategorii
 @app.callback(
@@ -254,26 +307,68 @@ def highlight_category(clickData, current_fig):
 
     return current_fig
 
-def export_images():
+# wykres trendów - czytany z magazynu przy każdej zmianie wyboru
+@app.callback(
+    Output('trend-graph', 'figure'),
+    Input('trend-categories', 'value')
+)
+def update_trend(selected):
+    return trend_figure(selected or [])
+
+# Warianty eksportu: (sufiks nazwy pliku, format, skala względem rozmiaru figury)
+IMAGE_RENDITIONS = [("", "png", 1), ("@3x", "png", 3), ("_thumb", "png", 0.25)]
+COMBINED_RENDITIONS = [("", "png", 3), ("@1x", "png", 1), ("_thumb", "png", 0.25), ("", "pdf", 1)]
+
+def export_renditions(figures, renditions, width=None, height=None):
+    """Zapisuje SVG i warianty `renditions` dla każdej figury {nazwa pliku: figura}.
+
+    Wszystko, co renderuje kaleido (SVG oraz formaty bez lokalnego konwertera),
+    idzie jednym wywołaniem - jedna sesja przeglądarki. Pozostałe warianty
+    powstają z SVG w puli procesów (cairosvg).
+    """
+    local = [r for r in renditions if can_rasterize(r[1])]
+    jobs = []
+    for name, fig in figures.items():
+        jobs.append((fig, f"{name}.svg", "svg", 1))
+        for suffix, fmt, scale in renditions:
+            if (suffix, fmt, scale) not in local:
+                print(f"{name}{suffix}.{fmt} renderowany przez kaleido.")
+                jobs.append((fig, f"{name}{suffix}.{fmt}", fmt, scale))
+
+    # Pula tworzona przed kaleido, żeby procesy nie powstawały z działającą przeglądarką
+    with rendition_pool(len(figures) * len(local)) if local else contextlib.nullcontext() as pool:
+        figs, paths, formats, scales = zip(*jobs)
+        pio.write_images(list(figs), list(paths), format=list(formats), scale=list(scales),
+                         width=width, height=height)
+
+        futures = []
+        for name in figures if local else []:
+            with open(f"{name}.svg", "rb") as f:
+                svg = f.read()
+            futures += [pool.submit(rasterize, svg, f"{name}{suffix}.{fmt}", fmt, scale)
+                        for suffix, fmt, scale in local]
+        for future in futures:
+            future.result()
+
+def export_images(renditions=IMAGE_RENDITIONS):
     print("Eksportuję obrazy...")
     print(os.getcwd())
 
+    figures = {name: go.Figure(fig) for name, fig in shared_figures().items()}
+    fig1, fig2, fig3 = figures["activity"], figures["summary"], figures["donut"]
+
     fig1.write_html("activity_graph.html")
     fig2.write_html("summary_graph.html")
     fig3.write_html("donut_graph.html")
 
-    fig1.write_image("activity_graph.png")
-    fig2.write_image("summary_graph.png")
-    fig3.write_image("donut_graph.png")
-
-    fig1.write_image("activity_graph.svg")
-    fig2.write_image("summary_graph.svg")
-    fig3.write_image("donut_graph.svg")
+    export_renditions({"activity_graph": fig1, "summary_graph": fig2, "donut_graph": fig3}, renditions)
 
     print("Obrazy zapisane.")
 
-def export_combined():
+def export_combined(renditions=COMBINED_RENDITIONS):
     print("Eksportuję końcowe obrazy...")
+    figures = {name: go.Figure(fig) for name, fig in shared_figures().items()}
+    fig1, fig2, fig3 = figures["activity"], figures["summary"], figures["donut"]
 
     fig = make_subplots(
         rows=3,
@@ -317,25 +412,13 @@ def export_combined():
                 new_trace.showlegend = False
                 fig.add_trace(new_trace, row=3, col=i + 1)
 
-    try:
-        colors = kolory
-    except NameError:
-        colors = {
-            'Praca': '#1f77b4',
-            'Nauka': '#ff7f0e',
-            'Sport': '#2ca02c',
-            'Rozrywka': '#d62728',
-            'Odpoczynek': '#9467bd',
-            'Inne': '#8c564b'
-        }
-
-    for cat in categories:
+    for cat in (trace.name for trace in fig1.data):
         fig.add_trace(
             go.Scatter(
                 x=[None],
                 y=[None],
                 mode='markers',
-                marker=dict(size=10, color=colors.get(cat, '#333333')),
+                marker=dict(size=10, color=kolory.get(cat, fallback_color)),
                 name=cat,
                 legendgroup=cat,
                 showlegend=True
@@ -343,21 +426,15 @@ def export_combined():
             row=1, col=1
         )
 
-    # layout wykresu
+    # layout wykresu - czcionki ze specyfikacji
+    fonts = template["fonts"]
     fig.update_layout(
         height=1080,
         width=1920,
-        font=dict(
-            family="Roboto",
-            size=14,
-        ),
+        font=fonts["body"],
         title=dict(
             text="Podsumowanie tygodnia",
-            font=dict(
-                family="Roboto Slab",
-                size=38,
-                weight="bold",
-            ),
+            font=fonts["combined_title"],
             xanchor='center',
             x=0.5,
             yanchor='top',
@@ -373,29 +450,15 @@ def export_combined():
             bgcolor="rgba(255, 255, 255, 0.8)",
             bordercolor="rgba(0, 0, 0, 0.5)",
             borderwidth=1,
-            font=dict(
-                family="Roboto",
-                size=14
-            ),
+            font=fonts["body"],
             traceorder="normal",
             title=dict(
                 text="Kategoria",
-                font=dict(
-                    family="Roboto Slab",
-                    size=20,
-                    weight="bold",
-                )
+                font=fonts["legend_title"]
             )
         )
     )
 
-    for i, annotation in enumerate(fig.layout.annotations):
-        annotation.font.update(
-            family="Roboto Slab",
-            size=32,
-            weight="bold",
-        )
-
     # Pierwszy wykres (słupkowy) - górna część
     fig.update_xaxes(domain=[0.05, 0.90], row=1, col=1)
     fig.update_yaxes(domain=[0.70, 0.95], row=1, col=1)
@@ -451,7 +514,7 @@ def export_combined():
 
     # Kontrola rozmiaru i położenia tytułów podwykresów
     for i, annotation in enumerate(fig.layout.annotations):
-        annotation.font.size = 14
+        annotation.font.update(fonts["subplot_title"])
 
         # Położenie tytułów dla poszczególnych wykresów
         if i == 0:
@@ -465,8 +528,8 @@ def export_combined():
     # Ustawienia dodatkowych parametrów hovertool
     fig.update_layout(
         hoverlabel=dict(
-            font_size=14,
-            font_family="Roboto"
+            font_size=fonts["body"]["size"],
+            font_family=fonts["body"]["family"]
         )
     )
 
@@ -485,8 +548,7 @@ def export_combined():
                        },
                        'modeBarButtonsToAdd': ['toggleHover']
                    })
-    pio.write_image(fig, "combined_plots.png", scale=3, width=1920, height=1080)
-    pio.write_image(fig, "combined_plots.svg", width=1920, height=1080)
+    export_renditions({"combined_plots": fig}, renditions, width=1920, height=1080)
 
     print("Koniec eksportowania końcowych obrazów.")
 
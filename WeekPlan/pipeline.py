@@ -0,0 +1,309 @@
+"""Wsadowa walidacja i normalizacja planów tygodnia.
+
+Pliki czytane są asynchronicznie, grupowane w paczki i normalizowane w puli
+procesów. Kolejka odczytów i liczba paczek w toku są ograniczone, więc pamięć
+nie rośnie z liczbą plików. Błędne wiersze i pliki nie przerywają
+przetwarzania - trafiają do listy błędów danego pliku.
+
+    python pipeline.py plany/*.csv --workers 4 --batch-size 128 --errors bledy.json
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from spec import SPEC
+
+# Wewnętrzne nazwy kolumn dla ról danych; nazwy w pliku CSV pochodzą z SPEC["bindings"]
+INTERNAL_COLUMNS = {"day": "Day", "start": "StartTime", "end": "EndTime", "category": "Category"}
+REQUIRED_COLUMNS = list(INTERNAL_COLUMNS.values())
+SOURCE_COLUMNS = {INTERNAL_COLUMNS[role]: column for role, column in SPEC["bindings"].items()}
+DAY_ORDER = SPEC["layout"]["day_order"]
+MINUTES_PER_DAY = 24 * 60
+
+
+def _fold(values):
+    # Małe litery bez polskich znaków: "Środa" -> "sroda", "PONIEDZIAŁEK" -> "poniedzialek"
+    return (values.str.casefold()
+            .str.replace("ł", "l")
+            .str.normalize("NFKD")
+            .str.replace(r"[\u0300-\u036f]", "", regex=True))
+
+
+def _day_aliases():
+    folded = _fold(pd.Series(DAY_ORDER, dtype="string")).tolist()
+    short = [["pon", "pn"], ["wt"], ["sr"], ["czw", "cz"], ["pt", "piat"], ["sob", "so"], ["nd", "niedz", "ndz"]]
+    english = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+    aliases = {}
+    for day, name, abbrevs, eng in zip(DAY_ORDER, folded, short, english):
+        for alias in [name, eng, eng[:3], *abbrevs]:
+            aliases[alias] = day
+    return aliases
+
+
+DAY_ALIASES = _day_aliases()
+# Plan obejmuje jeden tydzień - po niedzieli nie ma następnego dnia
+NEXT_DAY = {day: DAY_ORDER[i + 1] for i, day in enumerate(DAY_ORDER[:-1])}
+
+
+def _parse_minutes(values):
+    parts = values.str.extract(r"^(\d{1,2})[:.](\d{2})$").astype("float")
+    hours, minutes = parts[0], parts[1]
+    total = hours * 60 + minutes
+    valid = (minutes < 60) & (total <= MINUTES_PER_DAY)
+    return total.where(valid)
+
+
+def _error(source, row, column, value, message):
+    # Błędy trafiają do plików JSON - brak wartości jako None, nie pd.NA
+    value = None if value is pd.NA else value
+    return {"file": source, "row": row, "column": column, "value": value, "message": message}
+
+
+def normalize_plan(frame, source="<plan>"):
+    """Waliduje i normalizuje plan; zwraca (ramka, lista błędów).
+
+    Wynikowa ramka ma kolumny Day, Category, StartFloat, EndFloat i Duration
+    (w godzinach). Przedziały przechodzące przez północ dzielone są na dwa
+    wiersze: do 24:00 danego dnia i od 00:00 dnia następnego. Część
+    przedziału wychodząca poza niedzielę (następny tydzień) jest odrzucana
+    i zgłaszana jako błąd.
+    """
+    frame, errors = _prepare(frame, source)
+    if frame is None:
+        return _empty_plan(), errors
+    plan, row_errors = _normalize([frame], [source])
+    return plan.drop(columns="Source"), errors + row_errors[0]
+
+
+def _prepare(frame, source):
+    frame = frame.rename(columns=lambda col: str(col).strip())
+    duplicated = frame.columns[frame.columns.duplicated()].unique().tolist()
+    if duplicated:
+        return None, [_error(source, None, None, None, f"Powtórzone kolumny: {', '.join(duplicated)}")]
+    missing = [SOURCE_COLUMNS[col] for col in REQUIRED_COLUMNS if SOURCE_COLUMNS[col] not in frame.columns]
+    if missing:
+        return None, [_error(source, None, None, None, f"Brak kolumn: {', '.join(missing)}")]
+    frame = frame[[SOURCE_COLUMNS[col] for col in REQUIRED_COLUMNS]]
+    frame.columns = REQUIRED_COLUMNS
+    return frame, []
+
+
+def _normalize(frames, sources):
+    # Jedno przejście wektorowe po wierszach wszystkich plików naraz. Kolumna Source
+    # to pozycja ramki na liście (ta sama ścieżka może wystąpić w paczce dwa razy);
+    # błędy zwracane są jako lista list, po jednej na ramkę
+    lengths = [len(frame) for frame in frames]
+    raw = pd.concat(frames, ignore_index=True).astype("string")
+    raw["Source"] = np.repeat(np.arange(len(frames)), lengths)
+    # +2: nagłówek CSV i numeracja wierszy od 1
+    raw["Row"] = np.concatenate([np.arange(2, n + 2) for n in lengths])
+    clean = raw[REQUIRED_COLUMNS].apply(lambda col: col.str.strip().str.replace(r"\s+", " ", regex=True))
+
+    day = _fold(clean["Day"]).map(DAY_ALIASES)
+    start = _parse_minutes(clean["StartTime"])
+    # 24:00 dopuszczalne tylko jako koniec przedziału
+    start = start.mask(start == MINUTES_PER_DAY)
+    end = _parse_minutes(clean["EndTime"])
+    # "00:00" jako koniec przedziału oznacza północ kończącą dzień
+    end = end.mask((end == 0) & (start > 0), MINUTES_PER_DAY)
+
+    checks = [
+        ("Day", day.isna(), "Nieznany dzień tygodnia"),
+        ("StartTime", start.isna(), "Niepoprawny czas (oczekiwano HH:MM)"),
+        ("EndTime", end.isna(), "Niepoprawny czas (oczekiwano HH:MM)"),
+        ("Category", clean["Category"].fillna("") == "", "Brak kategorii"),
+        ("EndTime", start == end, "Pusty przedział czasu"),
+    ]
+    errors = [[] for _ in frames]
+
+    def report(labels, column, message):
+        for idx in labels:
+            position = raw.at[idx, "Source"]
+            errors[position].append(_error(sources[position], int(raw.at[idx, "Row"]), SOURCE_COLUMNS[column],
+                                           raw.at[idx, column], message))
+
+    invalid = pd.Series(False, index=clean.index)
+    for column, mask, message in checks:
+        mask = mask.fillna(False).astype(bool)
+        report(clean.index[mask], column, message)
+        invalid |= mask
+
+    valid = ~invalid
+    plan = pd.DataFrame({
+        "Source": raw["Source"][valid],
+        "Day": day[valid],
+        "Category": clean["Category"][valid],
+        "Start": start[valid],
+        "End": end[valid],
+    })
+
+    crossing = plan["End"] < plan["Start"]
+    after_midnight = plan[crossing].assign(
+        Day=plan.loc[crossing, "Day"].map(NEXT_DAY),
+        Start=0.0,
+    )
+    # Po niedzieli zaczyna się kolejny tydzień - wiersz kończy się o 24:00, reszta jest zgłaszana
+    overflow = after_midnight["Day"].isna()
+    report(overflow[overflow].index, "EndTime", "Przedział wykracza poza niedzielę - obcięty do 24:00")
+    plan.loc[crossing, "End"] = MINUTES_PER_DAY
+    plan = pd.concat([plan, after_midnight[~overflow]])
+
+    plan = plan.assign(
+        Day=pd.Categorical(plan["Day"], categories=DAY_ORDER, ordered=True),
+    ).sort_values(["Source", "Day", "Start"], kind="stable")
+    return pd.DataFrame({
+        "Source": plan["Source"].to_numpy(),
+        "Day": plan["Day"].astype(str).to_numpy(),
+        "Category": plan["Category"].astype(str).to_numpy(),
+        "StartFloat": (plan["Start"] / 60).to_numpy(),
+        "EndFloat": (plan["End"] / 60).to_numpy(),
+        "Duration": ((plan["End"] - plan["Start"]) / 60).to_numpy(),
+    }), errors
+
+
+def _empty_plan():
+    return pd.DataFrame({
+        "Day": pd.Series(dtype=str),
+        "Category": pd.Series(dtype=str),
+        "StartFloat": pd.Series(dtype=float),
+        "EndFloat": pd.Series(dtype=float),
+        "Duration": pd.Series(dtype=float),
+    })
+
+
+def _process_batch(batch):
+    # Wyniki indeksowane pozycją w paczce, nie ścieżką - ten sam plik może wystąpić dwa razy
+    errors = [[] for _ in batch]
+    frames = []
+    positions = []
+    for position, (path, raw, read_error) in enumerate(batch):
+        if read_error is not None:
+            errors[position].append(_error(path, None, None, None, read_error))
+            continue
+        try:
+            frame = pd.read_csv(io.BytesIO(raw), dtype=str, keep_default_na=False)
+            frame, prepare_errors = _prepare(frame, path)
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as exc:
+            errors[position].append(_error(path, None, None, None, f"Nie można odczytać CSV: {exc}"))
+            continue
+        except Exception as exc:
+            errors[position].append(_error(path, None, None, None, f"Błąd przetwarzania: {exc!r}"))
+            continue
+        errors[position].extend(prepare_errors)
+        if frame is not None:
+            frames.append(frame)
+            positions.append(position)
+
+    plans = {}
+    paths = [path for path, _, _ in batch]
+    try:
+        if frames:
+            _collect(_normalize(frames, [paths[p] for p in positions]), positions, plans, errors)
+    except Exception:
+        # Nieprzewidziany błąd w paczce - powtórka plik po pliku, żeby dotknął tylko winnego
+        for frame, position in zip(frames, positions):
+            try:
+                _collect(_normalize([frame], [paths[position]]), [position], plans, errors)
+            except Exception as exc:
+                errors[position].append(_error(paths[position], None, None, None, f"Błąd przetwarzania: {exc!r}"))
+    return [(path, plans[position] if position in plans else _empty_plan(), errors[position]) for position, path in enumerate(paths)]
+
+
+def _collect(normalized, positions, plans, errors):
+    plan, row_errors = normalized
+    for position, frame_errors in zip(positions, row_errors):
+        errors[position].extend(frame_errors)
+    for index, group in plan.groupby("Source", sort=False):
+        plans[positions[index]] = group.drop(columns="Source").reset_index(drop=True)
+
+
+async def _read(path):
+    try:
+        raw = await asyncio.to_thread(Path(path).read_bytes)
+        return path, raw, None
+    except OSError as exc:
+        return path, None, f"Nie można otworzyć pliku: {exc}"
+
+
+async def validate_plans(paths, workers=None, batch_size=128, max_open=64, max_pending=None):
+    """Asynchroniczny generator zwracający (ścieżka, ramka, błędy) w miarę przetwarzania paczek.
+
+    Naraz czytanych jest najwyżej `max_open` plików, a do puli trafia najwyżej
+    `max_pending` paczek (domyślnie dwie na proces); kolejne odczyty czekają.
+    """
+    loop = asyncio.get_running_loop()
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    paths = iter(paths)
+    reads = asyncio.Queue(maxsize=max_open)
+    finished = object()
+
+    async def reader():
+        # Czytelnicy współdzielą iterator ścieżek; next() nie przeplata się z innymi zadaniami
+        for path in paths:
+            await reads.put(await _read(path))
+        await reads.put(finished)
+
+    readers = [asyncio.create_task(reader()) for _ in range(max_open)]
+    try:
+        with ProcessPoolExecutor(workers) as pool:
+            pending = set()
+            batch = []
+            active_readers = len(readers)
+            while active_readers:
+                item = await reads.get()
+                if item is finished:
+                    active_readers -= 1
+                else:
+                    batch.append(item)
+                if batch and (len(batch) == batch_size or not active_readers):
+                    if len(pending) >= max_pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for future in done:
+                            for result in future.result():
+                                yield result
+                    pending.add(loop.run_in_executor(pool, _process_batch, batch))
+                    batch = []
+            for future in asyncio.as_completed(pending):
+                for result in await future:
+                    yield result
+    finally:
+        for task in readers:
+            task.cancel()
+
+
+async def run_pipeline(paths, workers=None, batch_size=128):
+    start = time.perf_counter()
+    plans = {}
+    errors = []
+    async for path, plan, plan_errors in validate_plans(paths, workers, batch_size):
+        plans[path] = plan
+        errors.extend(plan_errors)
+    elapsed = time.perf_counter() - start
+    return plans, errors, elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Walidacja i normalizacja planów tygodnia.")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--errors", help="plik JSON na listę błędów")
+    args = parser.parse_args()
+
+    plans, errors, elapsed = asyncio.run(run_pipeline(args.paths, args.workers, args.batch_size))
+
+    failed = len({e["file"] for e in errors})
+    print(f"Plików: {len(plans)}, z błędami: {failed}, błędów: {len(errors)}")
+    print(f"Czas: {elapsed:.2f} s ({len(plans) / elapsed:.1f} plików/s)")
+    if args.errors:
+        with open(args.errors, "w", encoding="utf-8") as f:
+            json.dump(errors, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,74 @@
+"""Lokalne warianty eksportu (PNG, PDF, PS) renderowane z SVG przez cairosvg.
+
+Pula procesów powstaje przez fork tylko na Linuksie i zanim kaleido uruchomi
+przeglądarkę; na macOS fork jest niebezpieczny, a spawn zaimportowałby
+ponownie main.py (figury, kaleido), więc tam zostają wątki.
+
+Porównanie wyniku cairosvg z PNG wyrenderowanym przez kaleido:
+
+    python renditions.py activity_graph.svg activity_graph_kaleido.png --scale 1
+"""
+import argparse
+import io
+import multiprocessing as mp
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # OSError: brak systemowej biblioteki cairo
+    cairosvg = None
+
+# Formaty renderowane lokalnie z SVG; pozostałe (np. jpg, webp) idą przez kaleido
+CAIRO_CONVERTERS = {"png": "svg2png", "pdf": "svg2pdf", "ps": "svg2ps"}
+
+
+def can_rasterize(fmt):
+    return cairosvg is not None and fmt in CAIRO_CONVERTERS
+
+
+def rasterize(svg, path, fmt, scale):
+    getattr(cairosvg, CAIRO_CONVERTERS[fmt])(bytestring=svg, write_to=path, scale=scale)
+
+
+def rendition_pool(max_workers=None):
+    # cairosvg parsuje SVG w czystym Pythonie, więc wątki niewiele dają. Drzewa SVG
+    # nie da się współdzielić między wariantami - cairosvg modyfikuje je podczas rysowania.
+    max_workers = min(max_workers or os.cpu_count() or 1, os.cpu_count() or 1)
+    if not sys.platform.startswith("linux"):
+        return ThreadPoolExecutor(max_workers)
+    pool = ProcessPoolExecutor(max_workers, mp_context=mp.get_context("fork"))
+    # Przy fork pierwsze zadanie tworzy od razu wszystkie procesy - przed startem przeglądarki
+    pool.submit(int).result()
+    return pool
+
+
+def compare_png(svg, reference, scale=1):
+    """Rozmiar obu obrazów i średnia różnica kanałów (0-255) między cairosvg a PNG referencyjnym."""
+    from PIL import Image, ImageChops, ImageStat
+
+    candidate = Image.open(io.BytesIO(cairosvg.svg2png(bytestring=svg, scale=scale))).convert("RGB")
+    reference = Image.open(reference).convert("RGB")
+    if candidate.size != reference.size:
+        return {"size": candidate.size, "reference_size": reference.size, "mean_diff": None}
+    diff = ImageStat.Stat(ImageChops.difference(candidate, reference)).mean
+    return {"size": candidate.size, "reference_size": reference.size, "mean_diff": sum(diff) / len(diff)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Porównanie PNG z cairosvg z PNG z kaleido.")
+    parser.add_argument("svg")
+    parser.add_argument("reference", help="PNG z kaleido (pio.write_image) w tej samej skali")
+    parser.add_argument("--scale", type=float, default=1)
+    args = parser.parse_args()
+
+    if cairosvg is None:
+        parser.error("cairosvg lub systemowa biblioteka cairo nie jest dostępna")
+    with open(args.svg, "rb") as f:
+        result = compare_png(f.read(), args.reference, args.scale)
+    print(f"cairosvg: {result['size']}, kaleido: {result['reference_size']}")
+    if result["mean_diff"] is None:
+        print("Różne rozmiary obrazów.")
+    else:
+        print(f"Średnia różnica kanałów: {result['mean_diff']:.2f} / 255")
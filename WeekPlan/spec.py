@@ -0,0 +1,79 @@
+"""Deklaratywna specyfikacja wykresów WeekPlan i jej kompilacja do szablonu plotly.
+
+Domyślna specyfikacja kompilowana jest raz przy imporcie i współdzielona przez
+wszystkie figury w procesie. Kompilacja jest tańsza niż odczyt pliku, więc
+szablon nie jest zapisywany na dysk. Po register_template() każda nowa figura
+korzysta z niego jako z domyślnego.
+"""
+import plotly.io as pio
+
+SPEC = {
+    "palette": {
+        "Sen": "darkblue",
+        "Odpoczynek i rozrywka": "green",
+        "Transport": "gray",
+        "Studia": "orange",
+        "Obowiązki": "saddlebrown",
+        "Praca": "darkmagenta",
+        "Siłownia": "red"
+    },
+    "fallback_color": "lightgray",
+    "fonts": {
+        "title": {"family": "Roboto Slab, serif", "size": 24, "color": "#000"},
+        "body": {"family": "Roboto, sans-serif", "size": 14, "color": "#333"},
+        # Zbiorczy obraz tygodnia (export_combined)
+        "combined_title": {"family": "Roboto Slab, serif", "size": 38, "weight": "bold"},
+        "legend_title": {"family": "Roboto Slab, serif", "size": 20, "weight": "bold"},
+        "subplot_title": {"family": "Roboto Slab, serif", "size": 14, "weight": "bold"},
+    },
+    "layout": {
+        "day_order": ["Poniedziałek", "Wtorek", "Środa", "Czwartek", "Piątek", "Sobota", "Niedziela"],
+        "day_spacing": 10,
+        "bar_height": 5,
+    },
+    # Kolumny pliku CSV z planem dla poszczególnych ról danych
+    "bindings": {
+        "day": "Day",
+        "start": "StartTime",
+        "end": "EndTime",
+        "category": "Category",
+    },
+}
+
+
+def compile_spec(spec):
+    """Zamienia specyfikację na szablon plotly oraz gotowe mapowania kolorów i osi."""
+    return {
+        "template": {
+            "layout": {
+                "font": spec["fonts"]["body"],
+                "title": {"font": spec["fonts"]["title"]},
+                "colorway": list(spec["palette"].values()),
+            }
+        },
+        "colors": spec["palette"],
+        "fallback_color": spec["fallback_color"],
+        "fonts": spec["fonts"],
+        "day_order": spec["layout"]["day_order"],
+        # Pozycje dni na osi Y - niedziela na dole, poniedziałek na górze
+        "day_y": {day: i * spec["layout"]["day_spacing"]
+                  for i, day in enumerate(reversed(spec["layout"]["day_order"]))},
+        "bar_height": spec["layout"]["bar_height"],
+        "bindings": spec["bindings"],
+    }
+
+
+TEMPLATE = compile_spec(SPEC)
+
+
+def get_template(spec=SPEC):
+    return TEMPLATE if spec is SPEC else compile_spec(spec)
+
+
+def register_template(name="weekplan", spec=SPEC):
+    """Rejestruje skompilowany szablon w plotly i ustawia go jako domyślny (nałożony na 'plotly')."""
+    template = get_template(spec)
+    if name not in pio.templates:
+        pio.templates[name] = template["template"]
+    pio.templates.default = f"plotly+{name}"
+    return template
@@ -0,0 +1,202 @@
+"""Dopisywany (append-only) magazyn tygodniowych sum kategorii, mapowany do pamięci.
+
+Każdy rekord to jeden tydzień: minuty w układzie dzień x kategoria oraz suma
+narastająca minut każdej kategorii od pierwszego zapisanego tygodnia. Dzięki
+sumom narastającym udział tygodniowy i średnia krocząca to O(1) na punkt,
+niezależnie od liczby zapisanych tygodni.
+
+Nowe plany dopisuje się z jawnie podanym tygodniem (poniedziałek):
+
+    python trends.py 2026-10-12=plany/tydzien41.csv 2026-10-19=plany/tydzien42.csv
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+
+import numpy as np
+
+from pipeline import run_pipeline
+from spec import SPEC
+
+MINUTES_PER_WEEK = 7 * 24 * 60
+OTHER_CATEGORY = "Inne"
+
+
+class TrendStore:
+    """Magazyn tygodni; układ rekordu (kategorie, dni) ustalany przy pierwszym otwarciu.
+
+    Istniejący magazyn zawsze otwierany jest ze swoim zapisanym układem - nowe
+    kategorie ze specyfikacji trafiają przy dopisywaniu do "Inne", a nie
+    unieważniają pliku.
+    """
+
+    def __init__(self, path, categories, day_order):
+        self.path = path
+        meta_path = f"{path}.json"
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            categories, day_order = meta["categories"], meta["day_order"]
+            stored = True
+        except FileNotFoundError:
+            stored = False
+
+        self.categories = list(categories)
+        if OTHER_CATEGORY not in self.categories:
+            self.categories.append(OTHER_CATEGORY)
+        self.day_order = list(day_order)
+        self.dtype = np.dtype([
+            ("week", "<i8"),
+            ("minutes", "<f4", (len(self.day_order), len(self.categories))),
+            ("cumulative", "<f8", (len(self.categories),)),
+        ])
+        self._records = None
+
+        if not stored:
+            # Układ rekordu zapisany obok danych, atomowo - inne procesy mogą w tym czasie otwierać magazyn
+            tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"categories": self.categories, "day_order": self.day_order}, f, ensure_ascii=False)
+            os.replace(tmp_path, meta_path)
+
+    def _load(self):
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size % self.dtype.itemsize:
+            raise ValueError(f"{self.path}: rozmiar pliku nie jest wielokrotnością rekordu")
+        count = size // self.dtype.itemsize
+        if count == 0:
+            return np.zeros(0, dtype=self.dtype)
+        # Mapowanie odświeżane tylko, gdy plik urósł
+        if self._records is None or len(self._records) != count:
+            self._records = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(count,))
+        return self._records
+
+    def __len__(self):
+        return len(self._load())
+
+    def weeks(self):
+        return [datetime.date.fromordinal(int(w)) for w in self._load()["week"]]
+
+    def append(self, week, frame):
+        """Dopisuje tydzień zaczynający się w poniedziałek `week`.
+
+        `frame` musi mieć kolumny Day, Category i Duration (w godzinach);
+        kategorie spoza magazynu liczone są jako "Inne". Zwraca False, jeśli
+        ten lub późniejszy tydzień jest już zapisany.
+        """
+        if week.weekday() != 0:
+            raise ValueError(f"{week} nie jest poniedziałkiem")
+        records = self._load()
+        ordinal = week.toordinal()
+        if len(records) and ordinal <= records["week"][-1]:
+            return False
+
+        record = np.zeros(1, dtype=self.dtype)
+        record["week"] = ordinal
+        day_index = {day: i for i, day in enumerate(self.day_order)}
+        cat_index = {cat: i for i, cat in enumerate(self.categories)}
+        totals = frame.groupby(["Day", "Category"])["Duration"].sum()
+        for (day, cat), hours in totals.items():
+            if day in day_index:
+                c = cat_index.get(cat, cat_index[OTHER_CATEGORY])
+                record["minutes"][0, day_index[day], c] += hours * 60
+
+        previous = records["cumulative"][-1] if len(records) else 0
+        record["cumulative"][0] = previous + record["minutes"][0].sum(axis=0)
+
+        with open(self.path, "ab") as f:
+            f.write(record.tobytes())
+        return True
+
+    def _range(self, start, stop):
+        weeks = self._load()["week"]
+        lo = 0 if start is None else int(np.searchsorted(weeks, start.toordinal(), side="left"))
+        hi = len(weeks) if stop is None else int(np.searchsorted(weeks, stop.toordinal(), side="right"))
+        return lo, hi
+
+    def _weeks(self, lo, hi):
+        return [datetime.date.fromordinal(int(w)) for w in self._load()["week"][lo:hi]]
+
+    def _cumulative_at(self, category, idx):
+        # Suma narastająca po tygodniu idx; dla idx < 0 (przed pierwszym tygodniem) zero
+        cumulative = self._load()["cumulative"][:, self.categories.index(category)]
+        return np.where(idx >= 0, cumulative[np.maximum(idx, 0)], 0.0)
+
+    def weekly_share(self, category, start=None, stop=None):
+        """Procent tygodnia spędzony na kategorii dla tygodni z zakresu [start, stop]."""
+        lo, hi = self._range(start, stop)
+        idx = np.arange(lo, hi)
+        minutes = self._cumulative_at(category, idx) - self._cumulative_at(category, idx - 1)
+        return self._weeks(lo, hi), minutes / MINUTES_PER_WEEK * 100
+
+    def rolling_share(self, category, window=4, start=None, stop=None):
+        """Średni udział kategorii z `window` tygodni kalendarzowych kończących się na danym tygodniu.
+
+        Średnia liczona jest z tygodni zapisanych w tym oknie - brakujący tydzień
+        nie wydłuża okna ani nie jest liczony jako zero.
+        """
+        lo, hi = self._range(start, stop)
+        idx = np.arange(lo, hi)
+        weeks = self._load()["week"]
+        first = np.searchsorted(weeks, weeks[lo:hi] - 7 * (window - 1), side="left")
+        minutes = self._cumulative_at(category, idx) - self._cumulative_at(category, first - 1)
+        weeks_in_window = idx - first + 1
+        return self._weeks(lo, hi), minutes / (weeks_in_window * MINUTES_PER_WEEK) * 100
+
+
+def open_store(path="trends.dat"):
+    """Magazyn z kategoriami i dniami ze specyfikacji wykresów."""
+    return TrendStore(path, SPEC["palette"].keys(), SPEC["layout"]["day_order"])
+
+
+def week_plan(value):
+    """Argument CLI "RRRR-MM-DD=plan.csv" -> (poniedziałek, ścieżka)."""
+    week, sep, path = value.partition("=")
+    if not sep or not path:
+        raise argparse.ArgumentTypeError(f"oczekiwano RRRR-MM-DD=plan.csv, podano {value!r}")
+    try:
+        week = datetime.date.fromisoformat(week)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"niepoprawna data: {week!r}")
+    if week.weekday() != 0:
+        raise argparse.ArgumentTypeError(f"{week} nie jest poniedziałkiem")
+    return week, path
+
+
+def ingest(store, weekly_paths):
+    """Dopisuje plany {poniedziałek: ścieżka CSV} po walidacji; zwraca (dopisane tygodnie, błędy)."""
+    # Ten sam plik może opisywać kilka tygodni - walidowany jest raz
+    plans, errors, _ = asyncio.run(run_pipeline(list(dict.fromkeys(weekly_paths.values()))))
+    added = []
+    for week, path in sorted(weekly_paths.items()):
+        # Plik bez żadnego poprawnego wiersza zapisałby pusty tydzień
+        if plans[path].empty:
+            continue
+        # Nakładające się przedziały dałyby tydzień dłuższy niż 100%
+        share = plans[path]["Duration"].sum() * 60 / MINUTES_PER_WEEK * 100
+        if share > 100 + 1e-6:
+            errors.append({"file": path, "row": None, "column": None, "value": None,
+                           "message": f"Suma kategorii to {share:.1f}% tygodnia (ponad 100%) - tydzień {week} pominięty"})
+            continue
+        if store.append(week, plans[path]):
+            added.append(week)
+    return added, errors
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Dopisywanie tygodniowych planów do magazynu trendów.")
+    parser.add_argument("plans", nargs="+", type=week_plan, metavar="RRRR-MM-DD=plan.csv",
+                        help="poniedziałek tygodnia i plik z planem")
+    parser.add_argument("--store", default="trends.dat")
+    args = parser.parse_args()
+
+    weekly_paths = dict(args.plans)
+    if len(weekly_paths) != len(args.plans):
+        parser.error("ten sam tydzień podany więcej niż raz")
+
+    added, errors = ingest(open_store(args.store), weekly_paths)
+    for error in errors:
+        print(f"{error['file']}, wiersz {error['row']}: {error['message']}")
+    print(f"Dopisane tygodnie: {len(added)} z {len(weekly_paths)}")